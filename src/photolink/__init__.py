@@ -1,4 +1,5 @@
 import configparser
+import functools
 import os
 import sys
 from pathlib import Path
@@ -56,6 +57,7 @@ configuration = SingletonPath()
 
 
 # should be used when using pyinstaller
+@functools.lru_cache(maxsize=1)
 def get_application_path() -> Path:
     """Get the application path."""
     return configuration.application_path
@@ -68,6 +70,11 @@ def read_config(file) -> dict:
     return config
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> dict:
-    """Get the config file from cache."""
+    """Get the config file from cache.
+
+    The same parser instance is shared by every caller, so treat it as
+    read-only and do not mutate it.
+    """
     return configuration.config
@@ -1,12 +1,16 @@
 """Divide functional and UI related logic."""
 
-import json
+import hashlib
+import os
+import sqlite3
 import sys
 import time
+from collections import namedtuple
 from pathlib import Path
 
+import orjson
 from loguru import logger
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtWidgets import QLabel, QMessageBox
 
 import photolink.pipeline.settings as settings
@@ -14,10 +18,110 @@ import photolink.utils.enums as enums
 from photolink import get_application_path, get_config
 from photolink.pipeline.front import MainWindowFront, ProcessWidget
 from photolink.pipeline.qss import *
-from photolink.utils.function import search_all_images
+from photolink.utils.function import search_all_images_cached
 from photolink.workers.worker import Worker
 
 
+# Task box background template; formatted once per color pair and cached.
+GRADIENT_TPL = (
+    "background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {c1}, stop:1 {c2}); "
+    "border: 2px solid black;"
+)
+
+# Per-task UI behaviour, keyed by the task button label. Adding a task is one
+# entry here instead of another branch in select_task.
+TaskSpec = namedtuple(
+    "TaskSpec", ["task", "placeholder", "ref_enabled", "box_attr", "colors_attr"]
+)
+
+TASK_SPECS = {
+    "Face Search": TaskSpec(
+        enums.Task.FACE_SEARCH, "", True, "sample_match_box", "matching_color"
+    ),
+    "Cluster": TaskSpec(
+        enums.Task.CLUSTERING,
+        "Not required for clustering",
+        False,
+        "cluster_box",
+        "clustering_color",
+    ),
+    "DP2 Match": TaskSpec(enums.Task.DP2_MATCH, "", True, "dp2_box", "dp2_color"),
+}
+
+
+class ScanSignals(QObject):
+    """Signals emitted by the directory scan runnable."""
+
+    finished = Signal(dict, object)
+    error = Signal(str)
+
+
+class ScanRunnable(QRunnable):
+    """Walk the selected directories off the GUI thread so the event loop keeps pumping.
+
+    The job.db and job.json writes happen here too: on six-figure file counts
+    they are far too slow to run on the main thread.
+    """
+
+    def __init__(self, paths: dict, job: dict, cache_dir: Path, last_job_hash):
+        super().__init__()
+        self.paths = paths
+        self.job = job
+        self.cache_dir = cache_dir
+        self.last_job_hash = last_job_hash
+        self.signals = ScanSignals()
+
+    def run(self):
+        try:
+            files = {
+                key: search_all_images_cached(path)
+                for key, path in self.paths.items()
+            }
+            job_hash = self._persist_job(files)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        self.signals.finished.emit(self.job, job_hash)
+
+    def _persist_job(self, files: dict):
+        """Write job.db and job.json for the worker, returning the job digest."""
+
+        # keep the big path lists out of job.json. The worker batch-reads the
+        # rows instead of holding a second copy of every path in memory.
+        db_path = self.cache_dir / "job.db"
+        connection = sqlite3.connect(db_path)
+        connection.execute("PRAGMA journal_mode=WAL;")
+        connection.execute("PRAGMA synchronous=OFF;")
+        connection.execute("CREATE TABLE IF NOT EXISTS files (path TEXT, role TEXT)")
+        connection.execute("DELETE FROM files")
+
+        for role, file_list in files.items():
+            connection.executemany(
+                "INSERT INTO files VALUES (?, ?)", ((p, role) for p in file_list)
+            )
+            self.job[role] = {"db": str(db_path), "role": role}
+
+        connection.commit()
+        connection.close()
+
+        # orjson encodes the path lists in C, several times faster than stdlib json.
+        job_json = self.cache_dir / "job.json"
+        data = orjson.dumps(self.job, option=orjson.OPT_NON_STR_KEYS)
+
+        # skip the disk write when the job has not changed since the last run,
+        # e.g. an immediate retry on the same paths. blake2b is cheap enough
+        # that the check costs nothing next to the write it saves.
+        job_hash = hashlib.blake2b(data, digest_size=16).digest()
+
+        if job_hash != self.last_job_hash or not job_json.exists():
+            tmp_file = job_json.with_suffix(".tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, job_json)
+
+        return job_hash
+
+
 class MainWindow(MainWindowFront):
     """All functional codes related to Pyside go here."""
 
@@ -32,14 +136,28 @@ class MainWindow(MainWindowFront):
         )
         self.job = {}
         self.operating_system = sys.platform
+        self._gradient_cache = {}
+        self._last_job_hash = None
+        self._scan_cancelled = False
         self.drawUI()
         self.current_progress = 0
-        self.threads = []
 
-        # setup log path.
-        logger.info(f"Application path: {self.application_path}")
-        logger.info(f"Cache dir: {self.cache_dir}")
-        logger.info(f"Operating system: {self.operating_system}")
+        # persistent worker thread. Jobs are queued onto it via submit()
+        # instead of spawning (and leaking) a new thread per run.
+        self.worker = Worker(
+            batch_size=self.config.getint("INFERENCE", "BATCH_SIZE", fallback=32)
+        )
+        self.worker.signals.stopped.connect(self.task_interrupted)
+        self.worker.signals.result.connect(self.task_result)
+        self.worker.signals.finished.connect(self.task_finished)
+        self.worker.signals.error.connect(self.task_error)
+        self.worker.start()
+
+        # setup log path. Deferred formatting so the strings are only built
+        # when the log level is enabled.
+        logger.info("Application path: {}", self.application_path)
+        logger.info("Cache dir: {}", self.cache_dir)
+        logger.info("Operating system: {}", self.operating_system)
 
         # settings related signals.
         self.settings = settings.signals_object
@@ -52,119 +170,107 @@ class MainWindow(MainWindowFront):
         task = clicked_button.findChild(QLabel).text()
         self.select_task(task)
 
+    def _gradient_style(self, colors) -> str:
+        """Return the task box gradient for a color pair, formatting it only once."""
+        key = (colors[0], colors[1])
+        style = self._gradient_cache.get(key)
+
+        if style is None:
+            style = GRADIENT_TPL.format(c1=key[0], c2=key[1])
+            self._gradient_cache[key] = style
+
+        return style
+
     def select_task(self, task):
-        if task == "Face Search":
-            self.instruction_label.setText(enums.Task.FACE_SEARCH.value)
-            self.reference_path_selector.line_edit.setPlaceholderText("")
-            self.reference_path_selector.button.setEnabled(True)
-            self.current_task = enums.Task.FACE_SEARCH.name
-
-        elif task == "Cluster":
-            self.instruction_label.setText(enums.Task.CLUSTERING.value)
-            self.reference_path_selector.line_edit.setPlaceholderText(
-                "Not required for clustering"
-            )
-            # clean up reference path text
+        spec = TASK_SPECS[task]
+
+        self.instruction_label.setText(spec.task.value)
+        self.reference_path_selector.line_edit.setPlaceholderText(spec.placeholder)
+
+        # clean up reference path text when it is not needed.
+        if not spec.ref_enabled:
             self.reference_path_selector.line_edit.setText("")
-            self.reference_path_selector.button.setEnabled(False)
-            self.current_task = enums.Task.CLUSTERING.name
-
-        elif task == "DP2 Match":
-            self.instruction_label.setText(enums.Task.DP2_MATCH.value)
-            self.reference_path_selector.line_edit.setPlaceholderText("")
-            self.reference_path_selector.button.setEnabled(True)
-            self.current_task = enums.Task.DP2_MATCH.name
-
-        # Reset border colors for both boxes
-        self.sample_match_box.setStyleSheet(
-            f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {self.matching_color[0]}, stop:1 {self.matching_color[1]}); border: 2px solid black;"
-        )
-        self.cluster_box.setStyleSheet(
-            f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {self.clustering_color[0]}, stop:1 {self.clustering_color[1]}); border: 2px solid black;"
-        )
 
-        self.dp2_box.setStyleSheet(
-            f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {self.dp2_color[0]}, stop:1 {self.dp2_color[1]}); border: 2px solid black;"
-        )
+        self.reference_path_selector.button.setEnabled(spec.ref_enabled)
+        self.current_task = spec.task.name
 
-        # Highlight the selected box
-        if task == "Face Search":
-            self.sample_match_box.setStyleSheet(
-                self.sample_match_box.styleSheet() + " border: 2px solid white;"
-            )
-        elif task == "Cluster":
-            self.cluster_box.setStyleSheet(
-                self.cluster_box.styleSheet() + " border: 2px solid white;"
-            )
-        elif task == "DP2 Match":
-            self.dp2_box.setStyleSheet(
-                self.dp2_box.styleSheet() + " border: 2px solid white;"
+        # Reset border colors for all boxes
+        for other in TASK_SPECS.values():
+            getattr(self, other.box_attr).setStyleSheet(
+                self._gradient_style(getattr(self, other.colors_attr))
             )
 
-    def process_jobs(self):
-        """Call the multiprocessing method when the start button is clicked."""
-        self.change_button_status(False)
-        self.init_time = time.time()
-        self.log_message("Processing started.")
+        # Highlight the selected box
+        selected_box = getattr(self, spec.box_attr)
+        selected_box.setStyleSheet(
+            selected_box.styleSheet() + " border: 2px solid white;"
+        )
+
+    def _validate_and_collect_paths(self, need_ref: bool):
+        """Pull each selector path once, validate, and return canonical values.
+
+        Returns None after notifying the user when a required path is missing
+        or not a directory. The output path only needs to be non-empty since
+        the worker creates it.
+        """
+        source = self.source_path_selector.line_edit.text()
+        reference = self.reference_path_selector.line_edit.text()
+        output = self.output_path_selector.line_edit.text()
+
+        valid = bool(output) and os.path.isdir(source)
+
+        if need_ref:
+            valid = valid and os.path.isdir(reference)
 
-        # Check output path. Universal check for all tasks.
-        if not self.output_path_selector.line_edit.text():
+        if not valid:
             self.display_notification(
                 enums.ErrorMessage.PATH_NOT_SELECTED.name,
                 enums.ErrorMessage.PATH_NOT_SELECTED.value,
             )
-
             self.change_button_status(True)
-            return
+            return None
 
-        self.job["output"] = self.output_path_selector.line_edit.text()
-
-        # start by generating jobs based on the selected task
-        if (
-            self.current_task == enums.Task.FACE_SEARCH.name
-            or self.current_task == enums.Task.DP2_MATCH.name
-        ):
-
-            if (
-                not self.source_path_selector.line_edit.text()
-                or not self.reference_path_selector.line_edit.text()
-            ):
-                self.display_notification(
-                    enums.ErrorMessage.PATH_NOT_SELECTED.name,
-                    enums.ErrorMessage.PATH_NOT_SELECTED.value,
-                )
-                self.change_button_status(True)
-                return
-
-            self.job["task"] = self.current_task
-            self.job["source"] = search_all_images(
-                self.source_path_selector.line_edit.text()
-            )
-            self.job["reference"] = search_all_images(
-                self.reference_path_selector.line_edit.text()
-            )
+        paths = {"source": source, "output": output}
 
-        elif self.current_task == enums.Task.CLUSTERING.name:
+        if need_ref:
+            paths["reference"] = reference
 
-            # only source path is required for clustering.
-            if not self.source_path_selector.line_edit.text():
-                self.display_notification(
-                    enums.ErrorMessage.PATH_NOT_SELECTED.name,
-                    enums.ErrorMessage.PATH_NOT_SELECTED.value,
-                )
-                self.change_button_status(True)
-                return
+        return paths
 
-            self.job["task"] = self.current_task
-            self.job["source"] = search_all_images(
-                self.source_path_selector.line_edit.text()
-            )
-        else:
+    def process_jobs(self):
+        """Call the multiprocessing method when the start button is clicked."""
+        self.change_button_status(False)
+
+        # monotonic clock: immune to NTP jumps and much finer than time.time()
+        # on Windows.
+        self.init_time_ns = time.perf_counter_ns()
+        self.log_message("Processing started.")
+
+        if self.current_task not in enums.Task.__members__:
             self.change_button_status(True)
             raise ValueError("Invalid task selected")
 
-        # Now passed all validation, so display the progress bar.
+        # only clustering works without a reference folder.
+        paths = self._validate_and_collect_paths(
+            need_ref=self.current_task != enums.Task.CLUSTERING.name
+        )
+
+        if paths is None:
+            return
+
+        self.job["task"] = self.current_task
+        self.job["output"] = paths.pop("output")
+        self.job["batch_size"] = self.config.getint(
+            "INFERENCE", "BATCH_SIZE", fallback=32
+        )
+
+        # what is left are the directories that need scanning.
+        scan_paths = paths
+
+        # Now passed all validation, so display the progress bar right away
+        # for feedback while the directories are being indexed.
         self.progress_widget = ProcessWidget(self.stop_processing)
+        self.progress_widget.loading_label.setText("Indexing files...")
         self.progress_message_box = QMessageBox(self)
         self.progress_message_box.setWindowTitle("Processing has started. Please wait.")
         self.progress_message_box.setStandardButtons(QMessageBox.NoButton)
@@ -172,19 +278,33 @@ class MainWindow(MainWindowFront):
         self.progress_message_box.setGeometry(500, 300, 400, 400)
         self.progress_message_box.show()
 
-        # proceed to dump the job to a json file for worker nodes.
-        job_json = self.cache_dir / "job.json"
-        with open(job_json, "w") as f:
-            json.dump(self.job, f)
-
-        # start the worker on a thread. This will prevent the GUI from freezing.
-        worker = Worker(self.job["task"])
-        worker.signals.stopped.connect(self.task_interrupted)
-        worker.signals.result.connect(self.task_result)
-        worker.signals.finished.connect(self.task_finished)
-        worker.signals.error.connect(self.task_error)
-        worker.start()
-        self.threads.append(worker)
+        # walk the directories and persist the job off the GUI thread so the
+        # spinner keeps animating. The runnable works on a snapshot of the job.
+        self._scan_cancelled = False
+        scan = ScanRunnable(
+            scan_paths, dict(self.job), self.cache_dir, self._last_job_hash
+        )
+        scan.signals.finished.connect(self._on_scan_done)
+        scan.signals.error.connect(self.task_error)
+        QThreadPool.globalInstance().start(scan)
+
+    def _on_scan_done(self, job: dict, job_hash):
+        """Submit the job once the scan and cache writes have finished."""
+
+        # the user may have pressed Stop while the scan was still running;
+        # submitting now would clear the stop event and run the job headless.
+        # No job was submitted, so the worker's stopped signal never fires —
+        # mirror task_interrupted here or the buttons stay disabled forever.
+        if self._scan_cancelled:
+            self.log_message("Processing stopped.")
+            self.change_button_status(True)
+            return
+
+        self.job = job
+        self._last_job_hash = job_hash
+
+        # hand the job to the persistent worker thread.
+        self.worker.submit(self.job["task"])
 
     def task_interrupted(self):
         """Called when the process is stopped by user"""
@@ -195,17 +315,21 @@ class MainWindow(MainWindowFront):
 
     def task_finished(self):
         """Called when the Processing is finished."""
+        elapsed_s = (time.perf_counter_ns() - self.init_time_ns) / 1e9
         self.stop_processing()
         self.change_button_status(True)
-        self.display_notification("Complete", "All operations completed successfully.")
+        self.display_notification(
+            "Complete",
+            f"All operations completed successfully in {elapsed_s:.1f} seconds.",
+        )
         self.log_message("Processing finished.")
 
     def stop_processing(self):
         """Universal stop mechanism for the processing."""
+        self._scan_cancelled = True
         self.progress_widget.movie.stop()
         self.progress_widget.timer.stop()
-        for thread in self.threads:
-            thread.stop()
+        self.worker.stop()
         self.progress_message_box.accept()
         self.num_preprocessed = 0
         self.num_postprocessed = 0
@@ -213,7 +337,7 @@ class MainWindow(MainWindowFront):
 
     def task_error(self, error):
         """Called when an error has occured during processing."""
-        logger.error(f"Error has occured on the thread: {error}")
+        logger.error("Error has occured on the thread: {}", error)
         self.display_notification(
             "Error", f"An error has occured during processing: {error}"
         )
@@ -230,3 +354,8 @@ class MainWindow(MainWindowFront):
     def notify_cache_deleted(self):
         """Called when the cache is deleted."""
         self.log_message("Cache deleted successfully.")
+
+    def closeEvent(self, event):
+        """Shut the persistent worker down cleanly before the window closes."""
+        self.worker.shutdown()
+        super().closeEvent(event)
@@ -1,9 +1,11 @@
 """Divide functional and UI related logic."""
 
+import itertools
 import os
+import re
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Qt, QTimer, Signal
+from PySide6.QtCore import QBuffer, QByteArray, QSize, Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QFontMetrics, QIcon, QMovie
 from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtWidgets import (
@@ -27,10 +29,49 @@ import photolink.utils.enums as enums
 from photolink import get_application_path, get_config
 from photolink.pipeline.qss import *
 
+# Module-level media caches so repeat widget constructions skip disk reads.
+_GIF_CACHE: dict[str, QByteArray] = {}
+_SVG_CACHE: dict[str, QByteArray] = {}
+_ICON_CACHE: dict[str, QIcon] = {}
+
+# Case-insensitive filter for console messages, so log_message does not have
+# to allocate a lowercased copy of every line.
+_SOS_RE = re.compile(r"sos", re.IGNORECASE)
+
+# Grey gradient shown while processing; built once instead of per click.
+DISABLED_BUTTON_STYLE = (
+    "background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 grey, stop:1 darkgrey);"
+)
+
+
+def _cached_byte_array(cache: dict, path: str) -> QByteArray:
+    """Read the file once and serve subsequent requests from memory."""
+    data = cache.get(path)
+
+    if data is None:
+        data = QByteArray(Path(path).read_bytes())
+        cache[path] = data
+
+    return data
+
+
+def _shared_icon(path: str) -> QIcon:
+    """Share one QIcon per file path instead of re-reading the icon file."""
+    icon = _ICON_CACHE.get(path)
+
+    if icon is None:
+        icon = QIcon(path)
+        _ICON_CACHE[path] = icon
+
+    return icon
+
 
 class ProcessWidget(QWidget):
     """Widget that displays a loading spinner and a stop button when processing starts."""
 
+    # (width, height) of the longest message, shared by every instance.
+    _cached_label_size = None
+
     def __init__(self, stop_callback, parent=None):
         super().__init__(parent)
 
@@ -49,7 +90,11 @@ class ProcessWidget(QWidget):
         self.loading_gif = str(
             self.application_path / Path(self.config.get("IMAGES", "LOAD_GIF"))
         )
-        self.movie = QMovie(self.loading_gif)
+
+        # feed QMovie from the cached bytes; the buffer must outlive the movie.
+        self.movie_buffer = QBuffer(_cached_byte_array(_GIF_CACHE, self.loading_gif))
+        self.movie_buffer.open(QBuffer.ReadOnly)
+        self.movie = QMovie(self.movie_buffer, b"gif")
         self.spinner.setMovie(self.movie)
         self.movie.start()
 
@@ -67,7 +112,7 @@ class ProcessWidget(QWidget):
             "Almost done...hang in there! 🍺",
             "Go get a cup of coffee ☕, this may need a bit more time :)",
         ]
-        self.message_index = 0  # Track the current message index
+        self._message_iter = itertools.cycle(self.messages)
 
         # Set up the layout
         layout = QVBoxLayout()
@@ -79,32 +124,32 @@ class ProcessWidget(QWidget):
         # Measure the longest message to set a fixed size (after setting font)
         self.adjust_label_size()
 
-        # Set up the timer to change messages every 3 seconds
+        # Set up the timer to cycle through the messages
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_loading_message)
-        self.timer.start(8000)  # Update every 3000 milliseconds (3 seconds)
+        self.timer.start(8000)  # Update every 8000 milliseconds (8 seconds)
 
     def adjust_label_size(self):
         """Adjust the size of the loading label based on the longest message."""
-        # Ensure the font is applied to QLabel before measuring text
-        font_metrics = QFontMetrics(self.loading_label.font())
-        longest_message = max(
-            self.messages, key=lambda msg: font_metrics.horizontalAdvance(msg)
-        )
-        fixed_width = font_metrics.horizontalAdvance(longest_message)
-        fixed_height = font_metrics.height()
+        # The messages never change, so measure them once per process instead
+        # of calling into QFontMetrics for every widget construction.
+        if ProcessWidget._cached_label_size is None:
+            # Ensure the font is applied to QLabel before measuring text
+            font_metrics = QFontMetrics(self.loading_label.font())
+            fixed_width = max(
+                font_metrics.horizontalAdvance(msg) for msg in self.messages
+            )
+            ProcessWidget._cached_label_size = (fixed_width, font_metrics.height())
+
+        fixed_width, fixed_height = ProcessWidget._cached_label_size
 
         # Set the fixed size based on the longest message
         self.loading_label.setFixedWidth(fixed_width + 20)  # Add padding
         self.loading_label.setFixedHeight(fixed_height + 10)  # Add padding
 
     def update_loading_message(self):
-        """Update the loading label's text."""
-        # Update the label with the next message
-        self.loading_label.setText(self.messages[self.message_index])
-
-        # Move to the next message, loop back if at the end
-        self.message_index = (self.message_index + 1) % len(self.messages)
+        """Update the loading label's text with the next message in the cycle."""
+        self.loading_label.setText(next(self._message_iter))
 
 
 class MainWindowFront(QMainWindow):
@@ -112,6 +157,11 @@ class MainWindowFront(QMainWindow):
 
     refresh_requested = Signal()
 
+    # Shared fonts: construction involves font-database lookups, so build the
+    # task button font once and keep one title font per requested size.
+    _TITLE_FONT = None
+    _LATO_HAIRLINE_CACHE: dict[int, QFont] = {}
+
     def __init__(self):
         """All UI related codes go here."""
         super().__init__()
@@ -121,6 +171,39 @@ class MainWindowFront(QMainWindow):
         self.cache_dir = self.application_path / Path(".cache")
         self.setup_cache_dir(self.cache_dir)
 
+        # debounce resize events: the font/icon recompute only runs once the
+        # user has paused dragging for 50 ms instead of on every event.
+        self._pending_size = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_resize)
+
+    def _load_ui_config(self):
+        """Read all icon paths and task colors from config in one pass.
+
+        The result is cached on the instance so later lookups skip the
+        ConfigParser entirely.
+        """
+        if getattr(self, "_ui_config", None) is None:
+            images = self.config["IMAGES"]
+            ui = self.config["UI"]
+
+            icons = {
+                "settings": str(self.application_path / images.get("SETTING")),
+                "match": str(self.application_path / images.get("MATCH_ICON")),
+                "cluster": str(self.application_path / images.get("CLUSTER_ICON")),
+                "dp2": str(self.application_path / images.get("DP2_ICON")),
+            }
+            colors = {
+                "matching": ui.get("MATCHING_TASK_COLOR").split(","),
+                "clustering": ui.get("CLUSTERING_TASK_COLOR").split(","),
+                "dp2": ui.get("DP2_TASK_COLOR").split(","),
+            }
+            self._ui_config = (icons, colors)
+
+        return self._ui_config
+
     def drawUI(self):
         """Startup by drawing UI elements"""
         # Set default window size
@@ -140,13 +223,13 @@ class MainWindowFront(QMainWindow):
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         self.title_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
+        # Single pass over config for every icon path and task color.
+        icons, colors = self._load_ui_config()
+
         # Add gear icon button
         self.settings_button = QToolButton(self)
-        settings_icon = str(
-            self.application_path / Path(self.config.get("IMAGES", "SETTING"))
-        )
         self.settings_button.setIcon(
-            QIcon(settings_icon)
+            _shared_icon(icons["settings"])
         )  # Set the path to your gear icon
         self.settings_button.setStyleSheet(
             "border: none;"
@@ -165,35 +248,26 @@ class MainWindowFront(QMainWindow):
         self.grid_layout = QGridLayout()
 
         # Define button colors
-        self.matching_color = self.config.get("UI", "MATCHING_TASK_COLOR").split(",")
-        self.clustering_color = self.config.get("UI", "CLUSTERING_TASK_COLOR").split(
-            ","
-        )
-        self.dp2_color = self.config.get("UI", "DP2_TASK_COLOR").split(
-            ","
-        )  # Add this line
-
-        # Define button icons
-        match_icon = str(
-            self.application_path / Path(self.config.get("IMAGES", "MATCH_ICON"))
-        )
-        cluster_icon = str(
-            self.application_path / Path(self.config.get("IMAGES", "CLUSTER_ICON"))
-        )
-        dp2_icon = str(
-            self.application_path / Path(self.config.get("IMAGES", "DP2_ICON"))
-        )  # Add this line
+        self.matching_color = colors["matching"]
+        self.clustering_color = colors["clustering"]
+        self.dp2_color = colors["dp2"]
 
         # Create task selection boxes with button color and icon
         self.sample_match_box = self.create_task_button(
-            match_icon, "Face Search", self.matching_color[0], self.matching_color[1]
+            icons["match"],
+            "Face Search",
+            self.matching_color[0],
+            self.matching_color[1],
         )
         self.cluster_box = self.create_task_button(
-            cluster_icon, "Cluster", self.clustering_color[0], self.clustering_color[1]
+            icons["cluster"],
+            "Cluster",
+            self.clustering_color[0],
+            self.clustering_color[1],
         )
 
         self.dp2_box = self.create_task_button(
-            dp2_icon, "DP2 Match", self.dp2_color[0], self.dp2_color[1]
+            icons["dp2"], "DP2 Match", self.dp2_color[0], self.dp2_color[1]
         )
 
         # Add boxes to the grid layout
@@ -280,8 +354,9 @@ class MainWindowFront(QMainWindow):
         layout = QVBoxLayout(button)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Add SVG icon
-        svg_widget = QSvgWidget(svg_path, button)
+        # Add SVG icon from the cached bytes
+        svg_widget = QSvgWidget(button)
+        svg_widget.load(_cached_byte_array(_SVG_CACHE, svg_path))
         svg_widget.setStyleSheet("background-color: transparent; border: none;")
         svg_widget.setFixedSize(50, 50)
 
@@ -295,8 +370,9 @@ class MainWindowFront(QMainWindow):
         )
 
         # Set font using QFontDatabase
-        font = QFont("Arial", 20, QFont.Bold)
-        text_label.setFont(font)
+        if MainWindowFront._TITLE_FONT is None:
+            MainWindowFront._TITLE_FONT = QFont("Arial", 20, QFont.Bold)
+        text_label.setFont(MainWindowFront._TITLE_FONT)
         text_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         text_label.update()
         text_label.repaint()
@@ -364,31 +440,46 @@ class MainWindowFront(QMainWindow):
         """ "Log messages to the console."""
 
         # ignore some messages.
-        if "sos" in message.lower():
+        if _SOS_RE.search(message):
             return
 
         self.console.append(message)
 
     def on_resize(self, event):
+        # Stash the size and restart the timer; a burst of resize events
+        # collapses into a single _do_resize call.
+        self._pending_size = (self.width(), self.height())
+        self._resize_timer.start()
+
+        super().resizeEvent(event)
+
+    def _do_resize(self):
+        """Apply font/icon updates for the last resize event in a burst."""
+        width, height = self._pending_size
+
         # Adjust font size based on window height
-        font_size = max(16, self.height() // 25)
+        font_size = max(16, height // 25)
         self.update_font(font_size)
 
         # Adjust icon size based on window size
-        new_icon_size = QSize(self.width() // 20, self.height() // 20)
-        self.settings_button.setIconSize(new_icon_size)
-
-        super().resizeEvent(event)
+        self.settings_button.setIconSize(QSize(width // 20, height // 20))
 
     def update_font(self, font_size=24):
-        font = QFont("Lato Hairline", font_size, QFont.Bold)
+        font = self._LATO_HAIRLINE_CACHE.get(font_size)
+
+        if font is None:
+            font = QFont("Lato Hairline", font_size, QFont.Bold)
+            self._LATO_HAIRLINE_CACHE[font_size] = font
+
         self.title_label.setFont(font)
 
     def setup_cache_dir(self, cache_dir: Path):
-        """clean up cache folders on start up, and recreate dir"""
-        # set cache dir as env variable.
-        os.environ["CACHE_DIR"] = str(cache_dir)
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        """Ensure the cache dir exists and is exported, skipping redundant work."""
+        # set cache dir as env variable, only on the first call.
+        os.environ.setdefault("CACHE_DIR", str(cache_dir))
+
+        if not cache_dir.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
 
     def change_button_status(self, enable=True):
         """Change the status of the start and refresh buttons."""
@@ -398,12 +489,8 @@ class MainWindowFront(QMainWindow):
         if not enable:
             self.start_button.setText("Processing...")
             # make refresh button and start button grey
-            self.start_button.setStyleSheet(
-                "background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 grey, stop:1 darkgrey);"
-            )
-            self.refresh_button.setStyleSheet(
-                "background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 grey, stop:1 darkgrey);"
-            )
+            self.start_button.setStyleSheet(DISABLED_BUTTON_STYLE)
+            self.refresh_button.setStyleSheet(DISABLED_BUTTON_STYLE)
 
         else:
             self.start_button.setText("Start Processing")
@@ -46,125 +46,22 @@ class ClusteringAlgorithm(Enum):
 
 
 # TODO: CR2 removed. Add support for CR2 images if needed.
-IMAGE_EXTENSION = [
-    "ase",
-    "art",
-    "bmp",
-    "blp",
-    "cd5",
-    "cit",
-    "cpt",
-    "dib",
-    "djvu",
-    "egt",
-    "exif",
-    "gif",
-    "gpl",
-    "grf",
-    "icns",
-    "ico",
-    "iff",
-    "jng",
-    "jpeg",
-    "jpg",
-    "jfif",
-    "jp2",
-    "jps",
-    "lbm",
-    "max",
-    "miff",
-    "mng",
-    "msp",
-    "nef",
-    "nitf",
-    "ota",
-    "pbm",
-    "pc1",
-    "pc2",
-    "pc3",
-    "pcf",
-    "pcx",
-    "pdn",
-    "pgm",
-    "PI1",
-    "PI2",
-    "PI3",
-    "pict",
-    "pct",
-    "pnm",
-    "pns",
-    "ppm",
-    "psb",
-    "psd",
-    "pdd",
-    "psp",
-    "px",
-    "pxm",
-    "pxr",
-    "qfx",
-    "raw",
-    "rle",
-    "sct",
-    "sgi",
-    "rgb",
-    "int",
-    "bw",
-    "tga",
-    "tiff",
-    "tif",
-    "vtf",
-    "xbm",
-    "xcf",
-    "xpm",
-    "3dv",
-    "amf",
-    "ai",
-    "awg",
-    "cgm",
-    "cdr",
-    "cmx",
-    "dxf",
-    "e2d",
-    "egt",
-    "eps",
-    "fs",
-    "gbr",
-    "odg",
-    "svg",
-    "stl",
-    "vrml",
-    "x3d",
-    "sxd",
-    "v2d",
-    "vnd",
-    "wmf",
-    "emf",
-    "art",
-    "xar",
-    "png",
-    "webp",
-    "jxr",
-    "hdp",
-    "wdp",
-    "cur",
-    "ecw",
-    "iff",
-    "lbm",
-    "liff",
-    "nrrd",
-    "pam",
-    "pcx",
-    "pgf",
-    "sgi",
-    "rgb",
-    "rgba",
-    "bw",
-    "int",
-    "inta",
-    "sid",
-    "ras",
-    "sun",
-    "tga",
-    "heic",
-    "heif",
-]
+# Kept as a frozenset for O(1) membership checks on the scan hot path.
+IMAGE_EXTENSION = frozenset(
+    [
+        "ase", "art", "bmp", "blp", "cd5", "cit", "cpt", "dib",
+        "djvu", "egt", "exif", "gif", "gpl", "grf", "icns", "ico",
+        "iff", "jng", "jpeg", "jpg", "jfif", "jp2", "jps", "lbm",
+        "max", "miff", "mng", "msp", "nef", "nitf", "ota", "pbm",
+        "pc1", "pc2", "pc3", "pcf", "pcx", "pdn", "pgm", "pi1",
+        "pi2", "pi3", "pict", "pct", "pnm", "pns", "ppm", "psb",
+        "psd", "pdd", "psp", "px", "pxm", "pxr", "qfx", "raw",
+        "rle", "sct", "sgi", "rgb", "int", "bw", "tga", "tiff",
+        "tif", "vtf", "xbm", "xcf", "xpm", "3dv", "amf", "ai",
+        "awg", "cgm", "cdr", "cmx", "dxf", "e2d", "eps", "fs",
+        "gbr", "odg", "svg", "stl", "vrml", "x3d", "sxd", "v2d",
+        "vnd", "wmf", "emf", "xar", "png", "webp", "jxr", "hdp",
+        "wdp", "cur", "ecw", "liff", "nrrd", "pam", "pgf", "rgba",
+        "inta", "sid", "ras", "sun", "heic", "heif",
+    ]
+)
@@ -6,6 +6,8 @@ import os
 import pickle
 import re
 import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
@@ -17,8 +19,41 @@ import photolink.utils.enums as enums
 from photolink import get_application_path
 
 
+def _scan_subtree(root: str) -> list:
+    """Collect image files under root with os.scandir to avoid per-file stat calls."""
+    images = []
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+
+                    elif entry.is_file(follow_symlinks=False):
+                        _, sep, extension = entry.name.rpartition(".")
+
+                        if sep and extension.lower() in enums.IMAGE_EXTENSION:
+                            images.append(entry.path)
+
+        except OSError as e:
+            # match the old Path.glob behavior: skip unreadable directories
+            # instead of aborting the whole scan.
+            logger.warning(f"Skipping unreadable directory {current}: {e}")
+
+    return images
+
+
 def search_all_images(path: Path):
-    """Recursively search all images in a directory."""
+    """Recursively search all images in a directory.
+
+    The walk is I/O-bound, so top-level subdirectories are scanned in parallel
+    on a thread pool. This gives large wins on SSDs and network shares.
+    """
 
     def extract_number(path):
         match = re.search(r"(?i)(\d+)(?=\.jpg)", str(path))  # Case-insensitive
@@ -31,20 +66,108 @@ def search_all_images(path: Path):
         raise FileNotFoundError(f"Path not found: {path}")
 
     images = []
-    files = path.glob("**/*.*")  # Using Path.glob for compatibility
+    subdirs = []
 
-    for file in files:
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+
+                elif entry.is_file(follow_symlinks=False):
+                    _, sep, extension = entry.name.rpartition(".")
+
+                    if sep and extension.lower() in enums.IMAGE_EXTENSION:
+                        images.append(entry.path)
+
+    except OSError as e:
+        logger.warning(f"Skipping unreadable directory {path}: {e}")
 
-        extension = file.suffix.lower()[1:]
+    if subdirs:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
 
-        if extension in enums.IMAGE_EXTENSION:
-            images.append(str(file))  # Convert Path to str
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_scan_subtree, subdir) for subdir in subdirs]
 
-    images = sorted(images, key=extract_number)
+            for future in as_completed(futures):
+                images.extend(future.result())
+
+    # sort at the end so the parallel walk stays deterministic. The path
+    # tie-breaker matters: extract_number returns 0 for anything that is not
+    # a numbered jpg, and ties would otherwise keep arrival order.
+    images = sorted(images, key=lambda p: (extract_number(p), p))
 
     return images
 
 
+def _directory_signature(path: Path) -> list:
+    """Cheap signature for a directory tree: root mtime and top-level entry count."""
+    with os.scandir(path) as entries:
+        entry_count = sum(1 for _ in entries)
+    return [path.stat().st_mtime_ns, entry_count]
+
+
+def search_all_images_cached(path: Path) -> list:
+    """Wrapper around search_all_images backed by a persistent index in the cache dir.
+
+    The index maps each root path to a cheap directory signature plus the file
+    list from the last full walk, so repeat scans of unchanged trees skip the
+    walk entirely.
+    """
+    if isinstance(path, str):
+        path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Path not found: {path}")
+
+    cache_dir = os.getenv("CACHE_DIR")
+
+    # without a cache dir there is nowhere to persist the index.
+    if cache_dir is None:
+        return search_all_images(path)
+
+    index_file = Path(cache_dir) / "image_index.json"
+    index = read_json(index_file)
+    signature = _directory_signature(path)
+    entry = index.get(str(path))
+
+    if entry is not None and entry.get("sig") == signature:
+        logger.info(f"Image index hit for {path}. Skipping directory walk.")
+        return entry["files"]
+
+    images = search_all_images(path)
+    index[str(path)] = {"sig": signature, "files": images}
+
+    # write to a temp file first so concurrent readers never see a partial index.
+    tmp_file = index_file.with_suffix(".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_file, index_file)
+
+    return images
+
+
+def read_job_file_list(job_entry) -> list:
+    """Resolve a job entry to a list of image paths.
+
+    Entries are either inline lists or {"db": ..., "role": ...} references into
+    the job database written by the application.
+    """
+    if isinstance(job_entry, list):
+        return job_entry
+
+    connection = sqlite3.connect(job_entry["db"])
+
+    try:
+        cursor = connection.execute(
+            "SELECT path FROM files WHERE role=?", (job_entry["role"],)
+        )
+        return [row[0] for row in cursor]
+    finally:
+        connection.close()
+
+
 def search_all_xz_file(path: Path) -> list:
     """Recursively search all embeddings file in a directory."""
     embeddings = []
@@ -202,7 +325,7 @@ def get_relevant_embeddings(embeddings_path: Path, job_key: str) -> list:
 
     # invert key and values in hash_ dict, so path is key and hash is value.
     hash_inverted = {v: k for k, v in hash_.items()}
-    relevant_images = set(job[job_key])
+    relevant_images = set(read_job_file_list(job[job_key]))
 
     # relevant hashes, only if they are in the hash table.
     relevant_hashes = set(
@@ -96,8 +96,14 @@ def run_model_mp(
     fail_path: str,
     keep_top_n: int,
     stop_event: mp.Event,
+    batch_size: int = 32,
 ):
-    """Use concurrent.futures to run the models and save each result to a pickle file to cache path. Catch signals to stop the process."""
+    """Use concurrent.futures to run the models and save each result to a pickle file to cache path. Catch signals to stop the process.
+
+    Entries are submitted batch_size at a time so in-flight futures stay
+    bounded, while the manager, the process pool, and the models loaded in
+    its worker processes live for the whole run.
+    """
 
     # Using Manager for a shared flag
     manager = mp.Manager()
@@ -107,41 +113,48 @@ def run_model_mp(
     # This should have already been setup in the main function.
     hash_json_dict = function.read_hash_file(raise_missing_error=False)
     hash_json_dict_ = manager.dict(hash_json_dict)  # for thread safety.
+    stopped = False
 
     with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_entry = {
-            executor.submit(
-                run_task, entry, stop_flag, save_path, fail_path, keep_top_n
-            ): entry
-            for entry in entries
-        }
-
         try:
-            for future in as_completed(future_to_entry):
-                if stop_event.is_set():
-                    logger.warning(
-                        "JobProcessor: Stop event detected, shutting down executor."
-                    )
-                    stop_flag.value = 1  # Set the stop flag
-                    executor.shutdown(wait=False)
-                    break
-
-                try:
-                    result = future.result()
+            for start in range(0, len(entries), batch_size):
 
-                    if isinstance(result, str):
-                        logger.warning(result)
-                        continue
+                if stopped or stop_event.is_set():
+                    break
 
-                    # result is a tuple of (image_path, image_hash). Add to dict.
-                    image_path, image_hash = future.result()
-                    hash_json_dict_[image_hash] = image_path
-                    logger.info(
-                        f"run_model_mp: Processed entry {image_path}, hash: {image_hash}"
-                    )
-                except Exception as e:
-                    entry = future_to_entry[future]
-                    logger.error(f"Error processing entry {entry}: {e}")
+                future_to_entry = {
+                    executor.submit(
+                        run_task, entry, stop_flag, save_path, fail_path, keep_top_n
+                    ): entry
+                    for entry in entries[start : start + batch_size]
+                }
+
+                for future in as_completed(future_to_entry):
+                    if stop_event.is_set():
+                        logger.warning(
+                            "JobProcessor: Stop event detected, shutting down executor."
+                        )
+                        stop_flag.value = 1  # Set the stop flag
+                        executor.shutdown(wait=False)
+                        stopped = True
+                        break
+
+                    try:
+                        result = future.result()
+
+                        if isinstance(result, str):
+                            logger.warning(result)
+                            continue
+
+                        # result is a tuple of (image_path, image_hash). Add to dict.
+                        image_path, image_hash = result
+                        hash_json_dict_[image_hash] = image_path
+                        logger.info(
+                            f"run_model_mp: Processed entry {image_path}, hash: {image_hash}"
+                        )
+                    except Exception as e:
+                        entry = future_to_entry[future]
+                        logger.error(f"Error processing entry {entry}: {e}")
 
         except Exception as e:
             logger.error(f"Error during concurrent processing: {e}")
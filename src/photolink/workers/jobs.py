@@ -11,6 +11,7 @@ from pathlib import Path
 from loguru import logger
 
 import photolink.utils.enums as enums
+import photolink.utils.function as function
 import photolink.workers.functions as functions
 from photolink import get_application_path, get_config
 from photolink.workers import WorkerSignals
@@ -19,13 +20,16 @@ from photolink.workers import WorkerSignals
 class JobProcessor:
     """Process the jobs for the worker by calling function layer, and emit various signals back to the main application."""
 
-    def __init__(self, stop_event: mp.Event, signals: WorkerSignals):
+    def __init__(
+        self, stop_event: mp.Event, signals: WorkerSignals, batch_size: int = 32
+    ):
         self.application_path = get_application_path()
         self.config = get_config()
         self.cache_dir = self.application_path / ".cache"
         self.stop_event = stop_event
         self.jobs_file = self.cache_dir / Path("job.json")
         self.signals = signals
+        self.batch_size = batch_size
 
         if not self.cache_dir.exists():
             raise FileNotFoundError(f"Cache directory not found: {self.cache_dir}")
@@ -57,10 +61,12 @@ class JobProcessor:
     def run(self):
         """Run the job processor."""
         logger.info("Jobs executing. This may take a few minutes.")
-        self.source_list_images = self.jobs["source"]
+        self.source_list_images = function.read_job_file_list(self.jobs["source"])
 
         if self.task == enums.Task.FACE_SEARCH.name:
-            self.reference_list_images = self.jobs["reference"]
+            self.reference_list_images = function.read_job_file_list(
+                self.jobs["reference"]
+            )
 
             # Below function will listen for stop signals
             self.preprocess_sample_matching()
@@ -120,6 +126,7 @@ class JobProcessor:
                 fail_path=self.fail_path,
                 keep_top_n=self.top_n_face,
                 stop_event=self.stop_event,
+                batch_size=self.batch_size,
             )
 
             functions.run_model_mp(
@@ -129,6 +136,7 @@ class JobProcessor:
                 fail_path=self.fail_path,
                 keep_top_n=self.top_n_face,
                 stop_event=self.stop_event,
+                batch_size=self.batch_size,
             )
         except Exception as e:
             logger.error(
@@ -176,6 +184,7 @@ class JobProcessor:
                 fail_path=self.fail_path,
                 keep_top_n=self.top_n_face,
                 stop_event=self.stop_event,
+                batch_size=self.batch_size,
             )
         except Exception as e:
             logger.error(
@@ -1,6 +1,7 @@
 """Top logic layer right below application. Execute the jobs for the worker via threading."""
 
 import multiprocessing as mp
+import queue
 import sys
 import threading
 import traceback
@@ -14,20 +15,46 @@ from photolink.workers.monitor import ProgressMonitor
 
 
 class Worker(threading.Thread):
-    """Sits on top of jobs layer. Execute the jobs for the worker via threading to prevent GUI freeze. Calls the JobProcessor to run the jobs."""
+    """Persistent job queue thread sitting on top of the jobs layer.
 
-    def __init__(self, task):
-        super().__init__()
+    One instance lives for the whole application session: jobs are handed in
+    through submit() and executed one at a time, so repeat runs skip thread
+    startup and the application no longer accumulates finished threads.
+    """
+
+    def __init__(self, batch_size: int = 32):
+        super().__init__(daemon=True)
+        self.batch_size = batch_size
+        self.signals = WorkerSignals()
+        self.monitor = None
+
+        # Use this to send signals to the worker.
+        self._stop_event = mp.Event()
+        self._queue = queue.Queue()
+
+    def submit(self, task):
+        """Queue a job for execution."""
 
         # check task is proper enum
         if task not in enums.Task.__members__:
             raise ValueError(f"Invalid task: {task}")
 
-        self.task = task
-        self.signals = WorkerSignals()
+        self._stop_event.clear()
+        self._queue.put(task)
 
-        # Use this to send signals to the worker.
-        self._stop_event = mp.Event()
+    def run(self):
+        """Consume queued jobs until the shutdown sentinel arrives."""
+        while True:
+            task = self._queue.get()
+
+            if task is None:
+                break
+
+            self._run_job(task)
+            self._queue.task_done()
+
+    def _run_job(self, task):
+        """Execute a single job and emit the outcome back to the application."""
 
         # init progress monitor with some default values
         self.monitor = ProgressMonitor(
@@ -36,13 +63,14 @@ class Worker(threading.Thread):
             signals=self.signals,
             monitor_interval=3,
         )
-
-    def run(self):
-        """Run the worker thread to execute the jobs."""
         self.monitor.start()
 
         try:
-            job = JobProcessor(stop_event=self._stop_event, signals=self.signals)
+            job = JobProcessor(
+                stop_event=self._stop_event,
+                signals=self.signals,
+                batch_size=self.batch_size,
+            )
             result = job.run()
 
             # Emit the result back to application
@@ -50,8 +78,6 @@ class Worker(threading.Thread):
                 self.signals.finished.emit()
             elif result == enums.StatusMessage.STOPPED.name:
                 self.signals.stopped.emit()
-            elif result == enums.StatusMessage.ERROR.name:
-                self.signals.error.emit((exctype, value, traceback.format_exc()))
             else:
                 raise ValueError(f"Invalid result: {result}")
 
@@ -60,11 +86,18 @@ class Worker(threading.Thread):
             self.signals.error.emit((exctype, value, traceback.format_exc()))
 
     def stop(self):
-        """Stop and clean the worker my sending signals downwards.
+        """Stop the current job without tearing down the worker thread.
 
-        DO NOT emit signals here. This is only for stopping the worker.
+        DO NOT emit signals here. This is only for stopping the job.
         """
-        logger.warning("Worker: Stopping...")
+        logger.warning("Worker: Stopping current job...")
         self._stop_event.set()
-        self.monitor.join()
+
+        if self.monitor is not None and self.monitor.is_alive():
+            self.monitor.join()
+
+    def shutdown(self):
+        """Stop the current job and end the worker thread for good."""
+        self.stop()
+        self._queue.put(None)
         self.join()